@@ -143,8 +143,9 @@ class PVDER_SetupUtilities(BaseValues,Logging):
     def initialize_basic_specs(self):
         """Initialize number of ODEs and phases"""
         
-        self.n_ODE = templates.DER_design_template[self.DER_model_type]['basic_specs']['n_ODE'] #23  #Number of ODE's
-        self.n_phases = templates.DER_design_template[self.DER_model_type]['basic_specs']['n_phases'] #3 #Number of phases  
+        basic_specs = templates.DER_basic_specs[self.DER_model_type]
+        self.n_ODE = basic_specs.n_ODE #23  #Number of ODE's
+        self.n_phases = basic_specs.n_phases #3 #Number of phases
         
     def initialize_basic_options(self):
         """Initialize basic options"""  
@@ -163,36 +164,38 @@ class PVDER_SetupUtilities(BaseValues,Logging):
         """        
 
         if not self.standAlone:
+            basic_specs = templates.DER_basic_specs[self.DER_model_type]
+
             if 'gridFrequency' in DER_arguments:
                 self.gridFrequency = DER_arguments['gridFrequency']
             else:
                 raise ValueError('Grid voltage source Frequency need to be supplied if model is not stand alone!')
-            
-            if templates.DER_design_template[self.DER_model_type]['basic_specs']['n_phases'] >=1: #Check if model has one phase
+
+            if basic_specs.n_phases >=1: #Check if model has one phase
                 if 'gridVoltagePhaseA' in DER_arguments:
                     self.gridVoltagePhaseA = DER_arguments['gridVoltagePhaseA']/self.Vbase
                 else:
                     raise ValueError('Grid voltage source phase A need to be supplied if model is not stand alone!')
-               
-            if templates.DER_design_template[self.DER_model_type]['basic_specs']['n_phases'] >=2: #Check if model has 2 phases
-                if templates.DER_design_template[self.DER_model_type]['basic_specs']['unbalanced']: #Check if model is unbalanced
+
+            if basic_specs.n_phases >=2: #Check if model has 2 phases
+                if basic_specs.unbalanced: #Check if model is unbalanced
                     if 'gridVoltagePhaseB' in DER_arguments:
                         self.gridVoltagePhaseB = DER_arguments['gridVoltagePhaseB']/self.Vbase
                     else:
                         raise ValueError('Grid voltage source phase B need to be supplied if model is not stand alone!')
                 else:
                     self.gridVoltagePhaseB = utility_functions.Ub_calc(self.gridVoltagePhaseA)
-                    
-            if templates.DER_design_template[self.DER_model_type]['basic_specs']['n_phases'] >=3: #Check if model has 3 phases
-                if templates.DER_design_template[self.DER_model_type]['basic_specs']['unbalanced']: #Check if model is unbalanced
+
+            if basic_specs.n_phases >=3: #Check if model has 3 phases
+                if basic_specs.unbalanced: #Check if model is unbalanced
                     if 'gridVoltagePhaseC' in DER_arguments:
                         self.gridVoltagePhaseC = DER_arguments['gridVoltagePhaseC']/self.Vbase
                     else:
                         raise ValueError('Grid voltage source phase C need to be supplied if model is not stand alone!')
                 else:
                     self.gridVoltagePhaseC = utility_functions.Uc_calc(self.gridVoltagePhaseA)
-            
-            if templates.DER_design_template[self.DER_model_type]['basic_specs']['n_phases'] >=4: #Check if model has 3 phases
+
+            if basic_specs.n_phases >=4: #Check if model has 3 phases
                 raise ValueError('Model has more than 3 phases!')
                 
     def initialize_states(self,DER_arguments):
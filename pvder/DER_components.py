@@ -8,10 +8,13 @@ Created on Wed Mar 25 09:36:27 2020
 
 """PV-DER base class."""
 
+import os
+import copy
+
 import numpy as np
 import math
-import scipy
 from scipy.optimize import fsolve, minimize
+from scipy.special import lambertw
 
 from pvder.DER_check_and_initialize import PVDER_SetupUtilities
 from pvder.DER_features import PVDER_SmartFeatures
@@ -21,8 +24,40 @@ from pvder.grid_components import BaseValues
 from pvder import utility_functions
 from pvder import defaults,templates,specifications
 
+try:
+    from numba import njit
+except ImportError:  #numba is an optional dependency - fall back to the interpreted kernel
+    njit = None
+
+try:
+    import numexpr
+except ImportError:  #numexpr is an optional dependency - fall back to plain NumPy for batched kernels
+    numexpr = None
+
 logger = utility_functions.get_logger(defaults.LOGGING_LEVEL)
 
+_CONFIG_CACHE = {} #Parsed config dictionaries keyed by file path with their modification time
+
+def _make_ppv_calc(Iscr,Kv,Tactual,T0,Np,NpIrs,beta,Sbase):
+    """Specialize the PV module power kernel for one set of module parameters.
+
+    The module parameters never change between calls on the ODE hot path, so they are
+    baked into the returned closure as constants (and as compile time constants when
+    numba is available) instead of being re-read from the instance on every invocation.
+    """
+
+    def _ppv_core(Sinsol,Vdc_actual):
+
+        Iph = (Iscr+(Kv*(Tactual-T0)))*(Sinsol/100.0)
+        Ipv = (Np*Iph)-(NpIrs*(math.exp(beta*Vdc_actual)-1))
+
+        return Iph,Ipv,max(0.0,(Ipv*Vdc_actual))/Sbase
+
+    if njit is not None:
+        _ppv_core = njit(_ppv_core,fastmath=True)
+
+    return _ppv_core
+
 class SolarPVDER(PVDER_SetupUtilities,PVDER_SmartFeatures,PVDER_ModelUtilities,BaseValues):
     """
     Class for describing a Solar Photo-voltaic Distributed Energy Resource consisting of panel, converters, and
@@ -145,22 +180,24 @@ class SolarPVDER(PVDER_SetupUtilities,PVDER_SmartFeatures,PVDER_ModelUtilities,B
         found_arguments = kwargs.keys() #Arguments which were passed
         used_arguments =[]
         
-        for key, value in specifications.DER_argument_spec .items():
-            
-            if key in kwargs.keys():
-                if isinstance(kwargs[key],specifications.DER_argument_spec [key]['type']):
-                   DER_arguments.update({key:kwargs[key]})
+        for key, expected_type, default_value in specifications.DER_argument_items:
+
+            if key in kwargs:
+                value = kwargs[key]
+                if isinstance(value,expected_type):
+                   DER_arguments[key] = value
                    used_arguments.append(key)
                 else:
-                    raise ValueError('Found {} to have type:{} - Valid type:{}'.format(key,type(kwargs[key]),specifications.DER_argument_spec [key]['type']))
+                    raise ValueError('Found {} to have type:{} - Valid type:{}'.format(key,type(value),expected_type))
             elif key in DER_config: #Check if key available in config file
-                if isinstance(kwargs[key],specifications.DER_argument_spec [key]['type']):
-                    DER_arguments.update({key:DER_config[key]})
+                value = DER_config[key]
+                if isinstance(value,expected_type):
+                    DER_arguments[key] = value
                 else:
-                    raise ValueError('Found {} to have type:{} - Valid type:{}'.format(key,type(DER_config[key]),specifications.DER_argument_spec [key]['type']))
-            
-            elif specifications.DER_argument_spec [key]['default_value'] is not None:
-                DER_arguments.update({key:specifications.DER_argument_spec [key]['default_value']})
+                    raise ValueError('Found {} to have type:{} - Valid type:{}'.format(key,type(value),expected_type))
+
+            elif default_value is not None:
+                DER_arguments[key] = default_value
                 
         logger.debug('Used arguments:{}\nInvalid arguments:{}'.format(used_arguments,list(set(found_arguments).difference(set(used_arguments)))))       
         
@@ -204,10 +241,13 @@ class SolarPVDER(PVDER_SetupUtilities,PVDER_SmartFeatures,PVDER_ModelUtilities,B
     def check_model_type(self,DER_config,DER_parent_config):
         """Check basic specs in configuration."""
         
-        if 'model_type' in DER_config['basic_specs']:
-            DER_model_type_in_config = DER_config['basic_specs']['model_type']
-        elif 'model_type' in DER_parent_config['basic_specs']:
-            DER_model_type_in_config = DER_parent_config['basic_specs']['model_type']
+        basic_specs = DER_config['basic_specs']
+        parent_basic_specs = DER_parent_config['basic_specs']
+
+        if 'model_type' in basic_specs:
+            DER_model_type_in_config = basic_specs['model_type']
+        elif 'model_type' in parent_basic_specs:
+            DER_model_type_in_config = parent_basic_specs['model_type']
         else:
             raise ValueError('{}:Model type was not found for parameter ID {}!'.format(self.name,self.parameter_ID))
         
@@ -218,32 +258,46 @@ class SolarPVDER(PVDER_SetupUtilities,PVDER_SmartFeatures,PVDER_ModelUtilities,B
         """Check basic specs in DER config."""
         
         if self.DER_model_type in templates.DER_design_template:
-            
-            n_phases = self.DER_config['basic_specs']['n_phases']
-            if not n_phases == templates.DER_design_template[self.DER_model_type]['basic_specs']['n_phases']:
+
+            design_template = templates.DER_design_template[self.DER_model_type]
+            template_basic_specs = templates.DER_basic_specs[self.DER_model_type]
+            config_basic_specs = self.DER_config['basic_specs']
+
+            n_phases = config_basic_specs['n_phases']
+            if not n_phases == template_basic_specs.n_phases:
                 raise ValueError('{}:DER configuration with ID:{} has {} phases which is invalid for {} DER model!'.format(self.name,self.parameter_ID,n_phases,self.DER_model_type))
-            
-            if not n_phases == len(templates.DER_design_template[self.DER_model_type]['basic_specs']['phases']):
-                raise ValueError('{}:DER configuration with ID:{} has {} phases buf following phases were found {}!'.format(self.name,self.parameter_ID,n_phases,len(templates.DER_design_template[self.DER_model_type]['basic_specs']['phases'])))
-            
-            n_ODE = self.DER_config['basic_specs']['n_ODE']
-            if not n_ODE == templates.DER_design_template[self.DER_model_type]['basic_specs']['n_ODE']:
+
+            if not n_phases == len(template_basic_specs.phases):
+                raise ValueError('{}:DER configuration with ID:{} has {} phases buf following phases were found {}!'.format(self.name,self.parameter_ID,n_phases,len(template_basic_specs.phases)))
+
+            n_ODE = config_basic_specs['n_ODE']
+            if not n_ODE == template_basic_specs.n_ODE:
                 raise ValueError('{}:DER configuration with ID:{} has {} ODE equations which is invalid for {} DER model!'.format(self.name,self.parameter_ID,n_ODE,self.DER_model_type))
-            
-            if not n_ODE == len(templates.DER_design_template[self.DER_model_type]['initial_states']):
+
+            if not n_ODE == len(design_template['initial_states']):
                 raise ValueError('{}:DER configuration with ID:{} needs {} states, but only {} states were found for {} DER model!'.
-                                 format(self.name,self.parameter_ID,n_ODE,len(templates.DER_design_template[self.DER_model_type]['initial_states']),self.DER_model_type))
-                      
+                                 format(self.name,self.parameter_ID,n_ODE,len(design_template['initial_states']),self.DER_model_type))
+
         else:
             raise ValueError('{}:{} is an invalid DER model class'.format(self.name,self.DER_model_type)) 
             
     def read_config(self,configFile):
-        """Load config json file and return dictionary."""
-    
-        logger.debug('Reading configuration file:{}'.format(configFile))
-        confDict = utility_functions.read_json(configFile)
-        
-        return confDict
+        """Load config json file and return dictionary (cached until the file changes on disk)."""
+
+        try:
+            mtime_ns = os.stat(configFile).st_mtime_ns
+        except OSError:
+            mtime_ns = None
+
+        cached = _CONFIG_CACHE.get(configFile)
+        if cached is not None and mtime_ns is not None and cached[0] == mtime_ns:
+            confDict = cached[1]
+        else:
+            logger.debug('Reading configuration file:{}'.format(configFile))
+            confDict = utility_functions.read_json(configFile)
+            _CONFIG_CACHE[configFile] = (mtime_ns,confDict)
+
+        return copy.deepcopy(confDict) #Callers mutate the returned dictionary, so hand out a copy
 
 class PVModule(object):
     """
@@ -263,6 +317,8 @@ class PVModule(object):
     _Tactual_max = _Tactual_min + 35.0 #35 degree celsius
     _S_max = 100.0
     
+    _MPP_poly_cache = {} #MPP polynomial coefficients keyed by module parameters (shared across instances)
+
     Iscr = 8.03 #Cell short-circuit current at reference temperature and radiation
     Kv = 0.0017  #Short-circuit current temperature co-efficient 
     T0 = 273.15 + 25.0 #Cell reference temperature in Kelvin
@@ -298,21 +354,64 @@ class PVModule(object):
         
         
         self.Iph = self.Iph_calc()
-    
-    @property    
+
+    @property
+    def Tactual(self):
+        """PV module temperature in Kelvin."""
+
+        return self._Tactual
+
+    @Tactual.setter
+    def Tactual(self,Tactual):
+
+        if Tactual != getattr(self,'_Tactual',None): #Recompute cached constants only when temperature actually changes
+            self._Tactual = Tactual
+            self._update_module_constants()
+
+    def _update_module_constants(self):
+        """Cache sub-expressions that stay constant between temperature/module parameter updates."""
+
+        if hasattr(self,'Ns') and hasattr(self,'_Tactual'):
+            self._beta = self.q/(self.k*self._Tactual*self.A*self.Ns) #q/(k*Tactual*A*Ns)
+            self._NpIrs = self.Np*self.Irs
+            self._Iph_coef = (self.Iscr+(self.Kv*(self._Tactual-self.T0)))/100.0 #Iph per unit insolation
+            self._ppv_kernel = _make_ppv_calc(self.Iscr,self.Kv,self._Tactual,self.T0,
+                                              self.Np,self._NpIrs,self._beta,BaseValues.Sbase)
+
+    @property
     def Vdcmpp(self):
         """Voltage at maximum power point for given insolation and temperature"""
-        
-        #sol, = fsolve(lambda x: 2.5 - np.sqrt(x), 8)
-        self.Iph = self.Iph_calc() #This function uses solar insolation
-        
-        return fsolve(lambda Vdc0:-((self.Np*self.Irs*(scipy.exp((self.q*Vdc0)/(self.k*self.Tactual*self.A*self.Ns))))*(self.q/(self.k*self.Tactual*self.A*self.Ns))*Vdc0)-((self.Np*self.Irs*(scipy.exp((self.q*Vdc0)/(self.k*self.Tactual*self.A*self.Ns))-1)))\
-                       +(self.Np*self.Iph),self.Vdcmpp0)[0] #This is a time consuming operation 
+
+        if self.USE_POLYNOMIAL_MPP and hasattr(self,'z'): #Use the fitted polynomial when available (same model as MPP_table)
+            return np.polyval(self.z,self.Sinsol)
+
+        self.Iph = self._Iph_coef*self.Sinsol #Photocurrent for the current solar insolation
+
+        #The MPP condition -Np*Irs*exp(u)*u - Np*Irs*(exp(u)-1) + Np*Iph = 0 with u = q*Vdc/(k*Tactual*A*Ns)
+        #reduces to (1+u)*exp(u) = (Iph/Irs + 1), whose closed form solution is u = W(e*(Iph/Irs + 1)) - 1 (Lambert W function)
+        u = np.real(lambertw(math.e*((self.Iph/self.Irs) + 1.0))) - 1.0
+
+        if not np.isfinite(u):
+            return self._Vdcmpp_fsolve()
+
+        return u/self._beta
+
+    def _Vdcmpp_fsolve(self):
+        """MPP voltage from a root finding iteration (fallback for the closed form solution in `Vdcmpp`)."""
+
+        kTAN = 1.0/self._beta #k*Tactual*A*Ns (cached in _update_module_constants)
+        f = lambda x:-((self.Np*self.Irs*(math.exp((self.q*x[0])/kTAN)))*(self.q/kTAN)*x[0])-((self.Np*self.Irs*(math.exp((self.q*x[0])/kTAN)-1)))\
+                     +(self.Np*self.Iph)
+        #Analytic derivative avoids the forward difference Jacobian evaluations inside fsolve
+        fprime = lambda x:np.array([[-self.Np*self.Irs*((self.q/kTAN)**2)*x[0]*math.exp((self.q*x[0])/kTAN)\
+                                     -2*self.Np*self.Irs*(self.q/kTAN)*math.exp((self.q*x[0])/kTAN)]])
+
+        return fsolve(f,self.Vdcmpp0,fprime=fprime,xtol=1e-6,maxfev=50)[0]
     
     def Iph_calc(self):
         """Photocurrent from a single cell for given insolation and temperature."""
-        
-        return (self.Iscr+(self.Kv*(self.Tactual-self.T0)))*(self.Sinsol/100.0)
+
+        return self._Iph_coef*self.Sinsol
     
     def Ppv_calc(self,Vdc_actual):
         """PV panel power output from  solar insolation.
@@ -324,36 +423,65 @@ class PVModule(object):
              float: Power output from PV module in p.u.
         """
     
-        self.Iph = self.Iph_calc()
-        self.Ipv = (self.Np*self.Iph)-(self.Np*self.Irs*(math.exp((self.q*Vdc_actual)/(self.k*self.Tactual*self.A*self.Ns))-1))   #Faster  with Pure Python functions
-       
-        return max(0,(self.Ipv*Vdc_actual))/BaseValues.Sbase
-       
-       #return utility_functions.Ppv_calc(self.Iph,self.Np,self.Ns,Vdc_actual,self.Tactual,Grid.Sbase)
-    
+        self.Iph,self.Ipv,Ppv = self._ppv_kernel(self.Sinsol,Vdc_actual)
+
+        return Ppv
+
+    def Ppv_calc_batch(self,Vdc_actual,Sinsol):
+        """PV panel power output for arrays of DC link voltages and insolation levels.
+
+        Vectorized companion to `Ppv_calc` for parameter sweeps (e.g. Monte-Carlo insolation
+        studies) where calling the scalar kernel in a Python loop would dominate the run time.
+        Uses numexpr when available (SIMD + threaded evaluation), plain NumPy otherwise.
+        Does not update the `Iph`/`Ipv` instance attributes.
+
+        Args:
+          Vdc_actual (ndarray): DC link voltages in volts.
+          Sinsol (ndarray): Solar insolation levels in percentage.
+
+        Returns:
+             ndarray: Power output from PV module in p.u.
+        """
+
+        Vdc_actual = np.asarray(Vdc_actual,dtype=float)
+        Sinsol = np.asarray(Sinsol,dtype=float)
+
+        local_dict = {'Iscr':self.Iscr,'Kv':self.Kv,'Tactual':self._Tactual,'T0':self.T0,
+                      'Np':self.Np,'NpIrs':self._NpIrs,'beta':self._beta,
+                      'Sinsol':Sinsol,'Vdc':Vdc_actual}
+
+        if numexpr is not None:
+            Ppv = numexpr.evaluate('((Np*(Iscr+(Kv*(Tactual-T0)))*(Sinsol/100.0))-(NpIrs*(exp(beta*Vdc)-1)))*Vdc',
+                                   local_dict=local_dict)
+        else:
+            Ipv = (self.Np*self._Iph_coef*Sinsol)-(self._NpIrs*(np.exp(self._beta*Vdc_actual)-1))
+            Ppv = Ipv*Vdc_actual
+
+        return np.maximum(0.0,Ppv)/BaseValues.Sbase
+
     def fit_MPP_poly(self):
         """Method to fit MPP to a polynomial function."""
-        
+
         self.Tactual =  298.15  #Use constant temperature
         self._MPP_fit_points = 10
+
+        _cache_key = (self.parameter_ID,self.Np,self.Ns,self.Tactual) #Identical module parameters give an identical fit
+        if _cache_key in PVModule._MPP_poly_cache:
+            self.z = PVModule._MPP_poly_cache[_cache_key]
+            self.logger.debug('Reusing cached MPP polynomial for module parameter ID {}!'.format(self.parameter_ID))
+            return
+
         _Srange = np.linspace(self._S_min,self._S_max,self._MPP_fit_points+1)
-        _Vdcmpp_list = []
-        _Ppvmpp_list =[]
-        _Sinsol_list= []
-        self.logger('Calculating {} values for MPP polynomial fit!'.format(len(_Srange)))
-        for S in _Srange:
-            self.Sinsol = S
-            _Vdcmpp = self.Vdcmpp
-            _Ppvmpp = self.Ppv_calc(self.Vdcmpp)*BaseValues.Sbase
-            
-            _Sinsol_list.append(S)
-            _Vdcmpp_list.append(_Vdcmpp)
-            _Ppvmpp_list.append(_Ppvmpp)            
-        
-        _x = np.array(_Sinsol_list)
-        _y = np.array(_Vdcmpp_list)
-        self.z = np.polyfit(_x, _y, 3)
-        self.logger('Found polynomial for MPP :{:.4f}x^3 + {:.4f}x^2 +{:.4f}x^1 + {:.4f}!'.format(self.z[0],self.z[1],self.z[2], self.z[3]))        
+        self.logger.debug('Calculating {} values for MPP polynomial fit!'.format(len(_Srange)))
+
+        #Vectorized sweep over the insolation range using the closed form MPP solution
+        kTAN = 1.0/self._beta #(k*Tactual*A*Ns)/q
+        _Iph_range = self._Iph_coef*_Srange
+        _Vdcmpp_range = kTAN*(np.real(lambertw(math.e*((_Iph_range/self.Irs) + 1.0))) - 1.0)
+
+        self.z = np.polyfit(_Srange, _Vdcmpp_range, 3)
+        PVModule._MPP_poly_cache[_cache_key] = self.z
+        self.logger.debug('Found polynomial for MPP :{:.4f}x^3 + {:.4f}x^2 +{:.4f}x^1 + {:.4f}!'.format(self.z[0],self.z[1],self.z[2], self.z[3]))
         
     def initialize_module_parameters(self):
         """Initialize PV module parameters."""
@@ -365,6 +493,8 @@ class PVModule(object):
             self.Vdcmpp0 = self.module_parameters[self.parameter_ID]['Vdcmpp0']
             self.Vdcmpp_min = self.module_parameters[self.parameter_ID]['Vdcmpp_min']
             self.Vdcmpp_max = self.module_parameters[self.parameter_ID]['Vdcmpp_max']
-            
+
+            self._update_module_constants() #Np/Ns may have changed
+
         else:
             raise ValueError('PV module parameters not available for parameter ID {} '.format(self.parameter_ID))
\ No newline at end of file
@@ -10,7 +10,6 @@ import logging
 import numpy as np
 import math
 import cmath
-import scipy
 from scipy.optimize import fsolve, minimize
 
 from pvder.DER_components import SolarPVDER,PVModule
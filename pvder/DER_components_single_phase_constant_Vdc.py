@@ -4,7 +4,6 @@ from __future__ import division
 import numpy as np
 import math
 import cmath
-import scipy
 import six
 import pdb
 import warnings
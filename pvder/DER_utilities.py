@@ -98,8 +98,42 @@ class PVDER_ModelUtilities(BaseValues):
         
         """
         
-        return self.Kp_GCC*self.uc + self.xc #PI controller equation    
-    
+        return self.Kp_GCC*self.uc + self.xc #PI controller equation
+
+    #Structure-of-arrays views over the per-phase phasors (three phase models only)
+    @property
+    def v_phasors(self):
+        """PCC-LV side voltage phasors for phases a,b,c.
+
+        Returns:
+            ndarray: Complex array of length 3.
+
+        """
+
+        return np.array([self.va,self.vb,self.vc])
+
+    @property
+    def vt_phasors(self):
+        """Inverter terminal voltage phasors for phases a,b,c.
+
+        Returns:
+            ndarray: Complex array of length 3.
+
+        """
+
+        return np.array([self.vta,self.vtb,self.vtc])
+
+    @property
+    def i_phasors(self):
+        """Inverter current phasors for phases a,b,c.
+
+        Returns:
+            ndarray: Complex array of length 3.
+
+        """
+
+        return np.array([self.ia,self.ib,self.ic])
+
     #Controller outer loop equations (Current set-point)    
     def ia_ref_calc(self):
         """Phase A current reference"""
@@ -440,30 +440,26 @@ class DynamicSimulation(Grid,SimulationUtilities,Logging):
     def time_series_standalone_grid(self):
         """Time series grid voltage and frequency for standalone model."""
         
-        self.vag_t = []
-        self.vbg_t = []
-        self.vcg_t = []
-        self.wgrid_t = []
+        n_time_steps = len(self.t)
+        self.vag_t = np.empty(n_time_steps,dtype=np.complex128) #Preallocate instead of appending to lists
+        self.vbg_t = np.empty(n_time_steps,dtype=np.complex128)
+        self.vcg_t = np.empty(n_time_steps,dtype=np.complex128)
+        self.wgrid_t = np.empty(n_time_steps)
         for i,t in enumerate(self.t):   #Loop through grid events and calculate wgrid at each time step
 
                 Vagrid_new,self.grid_model.wgrid = self.simulation_events.grid_events(t)
-                
+
                 #Conversion of grid voltage setpoint
                 self.grid_model.vag = Vagrid_new*(self.grid_model.Vgridrated/self.Vbase)
                 self.grid_model.vbg = utility_functions.Ub_calc(self.grid_model.vag*self.grid_model.unbalance_ratio_b)
-                self.grid_model.vcg = utility_functions.Uc_calc(self.grid_model.vag*self.grid_model.unbalance_ratio_c)  
-        
-                self.vag_t.append(self.grid_model.vag)
-                self.vbg_t.append(self.grid_model.vbg)
-                self.vcg_t.append(self.grid_model.vcg)
-                
-                self.wgrid_t.append(self.grid_model.wgrid)
+                self.grid_model.vcg = utility_functions.Uc_calc(self.grid_model.vag*self.grid_model.unbalance_ratio_c)
+
+                self.vag_t[i] = self.grid_model.vag
+                self.vbg_t[i] = self.grid_model.vbg
+                self.vcg_t[i] = self.grid_model.vcg
+
+                self.wgrid_t[i] = self.grid_model.wgrid
 
-        self.vag_t = np.asarray(self.vag_t)
-        self.vbg_t = np.asarray(self.vbg_t)
-        self.vcg_t = np.asarray(self.vcg_t)
-        self.wgrid_t = np.asarray(self.wgrid_t)
-        
         self.vagR_t = self.vag_t.real
         self.vagI_t = self.vag_t.imag
         
@@ -495,10 +491,11 @@ class DynamicSimulation(Grid,SimulationUtilities,Logging):
     def time_series_PLL(self):
         """Calculate time series PLL and d-q quantities."""
         
-        self.vd_t = []
-        self.vq_t = []
-        self.we_t = []
-        
+        n_time_steps = len(self.t)
+        self.vd_t = np.empty(n_time_steps) #Preallocate instead of appending to lists
+        self.vq_t = np.empty(n_time_steps)
+        self.we_t = np.empty(n_time_steps)
+
         for i,t in enumerate(self.t):     #Loop through time steps and calculate d-q values at each time step
             
             self.PV_model.wte = self.wte_t[i]
@@ -518,13 +515,9 @@ class DynamicSimulation(Grid,SimulationUtilities,Logging):
                 
             self.PV_model.we = self.PV_model.we_calc() #Calculate inverter frequency from PLL equation
             
-            self.vd_t.append(self.PV_model.vd)
-            self.vq_t.append(self.PV_model.vq)
-            self.we_t.append(self.PV_model.we)
-            
-        self.vd_t = np.asarray(self.vd_t)
-        self.vq_t = np.asarray(self.vq_t)
-        self.we_t = np.asarray(self.we_t)
+            self.vd_t[i] = self.PV_model.vd
+            self.vq_t[i] = self.PV_model.vq
+            self.we_t[i] = self.PV_model.we
     
     def time_series_Zload1(self,tOverride=None):
         """Calculate time series load impedance."""
@@ -534,29 +527,27 @@ class DynamicSimulation(Grid,SimulationUtilities,Logging):
         else:
             tAll=self.t
 
-        self.Zload1_t = []
+        self.Zload1_t = np.empty(len(tAll),dtype=np.complex128) #Preallocate instead of appending to a list
         for i,t in enumerate(tAll):       #Loop through load events
-            _Zload1_actual =  self.simulation_events.load_events(t)  
+            _Zload1_actual =  self.simulation_events.load_events(t)
             _Zload1 = _Zload1_actual/self.PV_model.Zbase
-            
-            self.Zload1_t.append(_Zload1)
-        self.Zload1_t = np.asarray(self.Zload1_t)
+
+            self.Zload1_t[i] = _Zload1
         if not self.LOOP_MODE:
            self.simulation_events.reset_event_counters() #reset event counters
     
     def time_series_Ppv(self):
         """Calculate time series Solar PV power output."""
         
-        self.Ppv_t = []
-        self.Sinsol_t = []
+        n_time_steps = len(self.t)
+        self.Ppv_t = np.empty(n_time_steps) #Preallocate instead of appending to lists
+        self.Sinsol_t = np.empty(n_time_steps)
         for i,t in enumerate(self.t):       #Loop through solar events and calculate Ppv at each time step
            self.PV_model.Sinsol,self.PV_model.Tactual =  self.simulation_events.solar_events(t)  #Parse through solar events
            self.PV_model.Vdc = self.Vdc_t[i]
            self.PV_model.Iph = self.PV_model.Iph_calc()
-           self.Sinsol_t.append(self.PV_model.Sinsol)
-           self.Ppv_t.append(self.PV_model.Ppv_calc(self.PV_model.Vdc_actual))
-        self.Sinsol_t = np.asarray(self.Sinsol_t)
-        self.Ppv_t = np.asarray(self.Ppv_t)
+           self.Sinsol_t[i] = self.PV_model.Sinsol
+           self.Ppv_t[i] = self.PV_model.Ppv_calc(self.PV_model.Vdc_actual)
         if not self.LOOP_MODE:
             self.simulation_events.reset_event_counters() #reset event counters
     
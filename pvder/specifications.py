@@ -9,6 +9,7 @@ import six
 from pvder.grid_components import Grid,BaseValues
 
 steadystate_solver_spec = {'SLSQP':{'ftol': 1e-10, 'disp': True, 'maxiter':10000},
+               'trust-constr':{'xtol': 1e-10, 'gtol': 1e-8, 'disp': True, 'maxiter':500},
                'nelder-mead':{'xtol': 1e-8, 'disp': True, 'maxiter':10000}}
 
 if six.PY3:
@@ -31,4 +32,8 @@ DER_argument_spec = {'derId':{'default_value':None,'type':string_type},
                              'ia0':{'default_value':None,'type':complex},'xa0':{'default_value':None,'type':complex},
                              'ua0':{'default_value':None,'type':complex},
                              'xDC0':{'default_value':None,'type':float},
-                             'xP0':{'default_value':None,'type':float},'xQ0':{'default_value':None,'type':float}}
\ No newline at end of file
+                             'xP0':{'default_value':None,'type':float},'xQ0':{'default_value':None,'type':float}}
+
+#Flattened (key,type,default value) view of DER_argument_spec computed once at import,
+#so that argument checking doesn't repeat nested dictionary lookups per DER instance
+DER_argument_items = tuple((key,spec['type'],spec['default_value']) for key,spec in DER_argument_spec.items())
\ No newline at end of file
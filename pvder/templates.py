@@ -5,6 +5,8 @@ Created on Mon Mar 30 10:19:16 2020
 @author: splathottam
 """
 
+import collections
+
 single_phase_models = ["SolarPVDERSinglePhase","SolarPVDERSinglePhaseConstantVdc"]
 three_phase_models = ["SolarPVDERThreePhase","SolarPVDERThreePhaseConstantVdc","SolarPVDERThreePhaseBalanced"]
 
@@ -85,7 +87,19 @@ DER_design_template = {"SolarPVDERSinglePhase":
                        }
                        }
 
-#Voltage and frequency ride through settings from IEEE 1557-2018 Category III (Table 16, page 48) 
+BasicSpecs = collections.namedtuple('BasicSpecs',['phases','n_phases','n_ODE','unbalanced','model_type'])
+
+#Immutable attribute access view over the basic specs, built once at import so that the
+#setup/initialization paths avoid repeated nested dictionary lookups (balanced models omit
+#'unbalanced' in the template which defaults to False here)
+DER_basic_specs = {model:BasicSpecs(phases=design['basic_specs']['phases'],
+                                    n_phases=design['basic_specs']['n_phases'],
+                                    n_ODE=design['basic_specs']['n_ODE'],
+                                    unbalanced=design['basic_specs'].get('unbalanced',False),
+                                    model_type=design['basic_specs']['model_type'])
+                   for model,design in DER_design_template.items()}
+
+#Voltage and frequency ride through settings from IEEE 1557-2018 Category III (Table 16, page 48)
 #V1 to V2 - zone 2,V1 < - zone 1  SolarPVDER_ThreePhaseConstantVdc
     
 RT_config_template = {'LVRT':{'0':['V_threshold','t_threshold','mode','t_start','threshold_breach']},
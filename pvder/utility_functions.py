@@ -10,7 +10,16 @@ import six
 import json
 import logging
 import scipy.io as sio
-#from numba import jit
+
+try:
+    from numba import jit
+    NUMBA_AVAILABLE = True
+except ImportError:  #numba is an optional dependency - fall back to the interpreted functions
+    NUMBA_AVAILABLE = False
+    def jit(*args,**kwargs):
+        def decorator(func):
+            return func
+        return decorator
 
 def Urms_time_series(ua,ub,uc):
     """Function to calculate rms value of phasor quantities."""
@@ -36,7 +45,7 @@ def Uunbalance_calc(ua,ub,uc):
         
     return (max(ua,ub,uc) - min(ua,ub,uc))/uavg
 
-#@jit(nopython=True)
+@jit(nopython=True,cache=True)
 def Ppv_calc(Iph,Np,Ns,Vdc_actual,Tactual,Sbase):
     """Function to calculate PV module power output."""
     
@@ -48,20 +57,20 @@ def Ppv_calc(Iph,Np,Ns,Vdc_actual,Tactual,Sbase):
     Ipv = (Np*Iph)-(Np*Irs*(math.exp((q*Vdc_actual)/(k*Tactual*A*Ns))-1))   #Faster  with Pure Python functions
     return max(0,(Ipv*Vdc_actual))/Sbase    
 
-#@jit(nopython=True)
+@jit(nopython=True,cache=True)
 def S_calc(va,vb,vc,ia,ib,ic):
     """Function to calculate apparent power."""
     
     return (1/2)*(va*ia.conjugate() + vb*ib.conjugate() + vc*ic.conjugate())*1.0
 
 #Average duty cycle - Phase A
-#@jit(nopython=True)
+@jit(nopython=True,cache=True)
 def m_calc(Kp_GCC,u,x):
     """Duty cycle for a single phase."""
         
     return Kp_GCC*u + x #PI controller equation  
 
-#@jit(nopython=True)
+@jit(nopython=True,cache=True)
 def Urms_calc(ua,ub,uc):
     """Function to calculate rms value of scalar phasor quantities."""
     
@@ -72,18 +81,16 @@ def Urms_calc_1phase(ua):
     
     return abs(ua)/math.sqrt(2)  #Pure python implementation is faster      
 
-#@jit(nopython=True)    
+@jit(nopython=True,cache=True)
 def Ub_calc(Ua):
     """Convert phase A quantity to Phase B."""
-    
-    return Ua*np.power(np.e,1j*(-(2/3)*np.pi))
-    #return Ua*pow(math.e,1j*(-(2/3)*math.pi))  #Shift by -120 degrees
-#@jit(nopython=True)    
+
+    return Ua*cmath.exp(1j*(-(2/3)*math.pi))  #Shift by -120 degrees
+@jit(nopython=True,cache=True)
 def Uc_calc(Ua):
     """Convert phase A quantity to Phase C."""
-    
-    return Ua*np.power(np.e,1j*((2/3)*np.pi))
-    #return Ua*pow(math.e,1j*((2/3)*math.pi))  #Shift by -120 degrees
+
+    return Ua*cmath.exp(1j*((2/3)*math.pi))  #Shift by +120 degrees
 
 def relative_phase_calc(Uph1,Uph2,DEGREES=False):
     """Calculate relative phase between phasors between 0 to 2pi or 0 to 360 degrees."""
@@ -97,38 +104,37 @@ def relative_phase_calc(Uph1,Uph2,DEGREES=False):
     return del_phase
     
 
-#@jit(nopython=True)    
+@jit(nopython=True,cache=True)
 def phasor_to_time(upha = 1+1j*0.0,uphb = -0.5-1j*0.867,uphc = -0.5+1j*0.867,w=2.0*math.pi*60.0,t=0.0):
     """Convert a,b,c quantities from phasor domain to time domain."""
-    
+
     ra,pha = cmath.polar(upha)
     rb,phb = cmath.polar(uphb)
     rc,phc = cmath.polar(uphc)
-    #ua = (ra*np.exp(1j*(w*t+pha-(math.pi/2)))).real
-    #ub = (rb*np.exp(1j*(w*t+phb-(math.pi/2)))).real
-    #uc = (rc*np.exp(1j*(w*t+phc-(math.pi/2)))).real
-    
-    ua = ra*pow(math.e,1j*(w*t+pha-(math.pi/2))).real
-    ub = rb*pow(math.e,1j*(w*t+phb-(math.pi/2))).real
-    uc = rc*pow(math.e,1j*(w*t+phc-(math.pi/2))).real
-    return ua,ub,uc   
 
+    ua = ra*math.cos(w*t+pha-(math.pi/2))
+    ub = rb*math.cos(w*t+phb-(math.pi/2))
+    uc = rc*math.cos(w*t+phc-(math.pi/2))
+    return ua,ub,uc
+
+@jit(nopython=True,cache=True)
 def phasor_to_time_1phase(uph,w,t):
     """Convert a,b,c quantities (time series) from phasor domain to time domain."""
-    
+
     r,ph = cmath.polar(uph)
-    
-    return r*pow(math.e,1j*(w*t+ph-(math.pi/2))).real
-#@jit(nopython=True)
+
+    return r*math.cos(w*t+ph-(math.pi/2))
+@jit(nopython=True,cache=True)
 def abc_to_dq0(ua,ub,uc,wt=2*math.pi):
     """Convert to d-q."""
-    Us = (2/3)*(ua + ub*pow(math.e,1j*((2/3)*math.pi)) + uc*pow(math.e,1j*(-(2/3)*math.pi)))*pow(math.e,1j*(-wt))
-        
+    Us = (2/3)*(ua + ub*cmath.exp(1j*((2/3)*math.pi)) + uc*cmath.exp(1j*(-(2/3)*math.pi)))*cmath.exp(1j*(-wt))
+
     ud = Us.real
     uq = Us.imag
     u0 = (1/3)*(ua+ub+uc)
     return ud,uq,u0
 
+@jit(nopython=True,cache=True)
 def dq0_to_abc(ud,uq,u0,wt=2*math.pi):
     """Convert to abc."""
     
@@ -138,11 +144,12 @@ def dq0_to_abc(ud,uq,u0,wt=2*math.pi):
 
     return ua,ub,uc
 
+@jit(nopython=True,cache=True)
 def alpha_beta_to_d_q(ualpha,ubeta,wt):
     """Convert alpha-beta to d-q."""
-    
-    Us = (ualpha + 1j*ubeta)*pow(math.e,-1j*(wt))
-    #Us = (ualpha + 1j*ubeta)*pow(math.e,-1j*(wt-(math.pi/2)))
+
+    Us = (ualpha + 1j*ubeta)*cmath.exp(-1j*(wt))
+    #Us = (ualpha + 1j*ubeta)*cmath.exp(-1j*(wt-(math.pi/2)))
     
     ud = Us.real
     uq = Us.imag